@@ -10,7 +10,7 @@ Example::
     with open(pdf_file, "rb") as file:
         form = Form(
             file=File(
-                payload=file.read(),
+                payload=file,  # streamed; pass file.read() to buffer instead
                 file_name=pdf_file.name,
                 mime_type="application/pdf",
             )
@@ -22,14 +22,29 @@ Example::
             print(e)
 
 """
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+import contextlib
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Iterator
 
 import httpx
 
 from grobid.models.form import Form
 from grobid.models.response import Response
 
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+_RETRIES = 2
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    _HTTP2 = False
+else:
+    _HTTP2 = True
+
 
 class GrobidClientError(BaseException):
     """Exception for Client class."""
@@ -39,17 +54,140 @@ class GrobidClientError(BaseException):
 
 @dataclass
 class Client:
-    """Client for GROBID's processFulltextDocument endpoint."""
+    """Client for GROBID's processFulltextDocument endpoint.
+
+    The underlying httpx clients are created lazily and reused across
+    requests, so repeated requests share one connection pool instead of
+    paying a TCP + TLS handshake each time. Use the (async) context
+    manager protocol or call close()/aclose() to release the transport.
+
+    When cache_dir is set, successful responses for bytes payloads are
+    cached on disk keyed by the SHA-256 of the payload and form
+    parameters, so re-running the same PDF skips the round trip.
+
+    transport="aiohttp" routes the asynchronous methods through an
+    aiohttp session (requires the 'aiohttp' extra), which has lower
+    per-request overhead than httpx on high-throughput batch pipelines.
+    httpx remains the default.
+    """
 
     base_url: str
     form: Form
     timeout: int = 15
+    cache_dir: Path | None = None
+    transport: str = "httpx"
+
+    _url: str = field(default="", init=False, repr=False)
+    _aiohttp_session: Any = field(default=None, init=False, repr=False)
+    _sync_client: httpx.Client | None = field(default=None, init=False, repr=False)
+    _async_client: httpx.AsyncClient | None = field(
+        default=None, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
 
-    def __build_request(self) -> dict[str, Any]:
-        """Build request dictionary."""
+    def __post_init__(self) -> None:
+        """Precompute the endpoint URL, normalizing any trailing slash."""
         # FIXME: api url is hardcoded
-        url = f"{self.base_url}/api/processFulltextDocument"
-        return dict(url=url, files=self.form.to_dict(), timeout=self.timeout)
+        self._url = f"{self.base_url.rstrip('/')}/api/processFulltextDocument"
+
+    def _get_sync_client(self) -> httpx.Client:
+        """Return the cached httpx.Client, creating it on first use."""
+        with self._lock:
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(
+                    transport=httpx.HTTPTransport(
+                        retries=_RETRIES, limits=_LIMITS, http2=_HTTP2
+                    ),
+                    timeout=self.timeout,
+                )
+
+            return self._sync_client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the cached httpx.AsyncClient, creating it on first use."""
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(
+                    transport=httpx.AsyncHTTPTransport(
+                        retries=_RETRIES, limits=_LIMITS, http2=_HTTP2
+                    ),
+                    timeout=self.timeout,
+                )
+
+            return self._async_client
+
+    def _get_aiohttp_session(self):
+        """Return the cached aiohttp session, creating it on first use.
+
+        Raises:
+            GrobidClientError: if aiohttp is not installed
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise GrobidClientError(
+                "aiohttp is not installed. Run 'pip install grobid[aiohttp]'"
+            )
+
+        with self._lock:
+            if self._aiohttp_session is None:
+                self._aiohttp_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60),
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                )
+
+            return self._aiohttp_session
+
+    def close(self) -> None:
+        """Close the cached synchronous client, if any."""
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    async def aclose(self) -> None:
+        """Close the cached asynchronous client and session, if any."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+
+    def __enter__(self) -> "Client":
+        """Return self for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the synchronous client on context exit."""
+        self.close()
+
+    async def __aenter__(self) -> "Client":
+        """Return self for use as an async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the asynchronous client on context exit."""
+        await self.aclose()
+
+    def __build_request(self, form: Form | None = None) -> dict[str, Any]:
+        """Build request dictionary.
+
+        Args:
+            form: form to submit. Default is the form bound to the client.
+        """
+        if form is None:
+            form = self.form
+        if form._prebuilt is not None:
+            body, content_type = form._prebuilt
+            return dict(
+                url=self._url,
+                content=body,
+                headers={"Content-Type": content_type},
+                timeout=self.timeout,
+            )
+        return dict(url=self._url, files=form.to_dict(), timeout=self.timeout)
 
     def __build_response(self, response: httpx.Response) -> Response:
         """Build Response object.
@@ -66,23 +204,196 @@ class Client:
 
         return res
 
+    def __cache_path(self, form: Form) -> Path | None:
+        """Return the cache file for a form, or None if caching is off.
+
+        Only bytes payloads are cacheable; hashing a file-like payload
+        would consume it.
+        """
+        if self.cache_dir is None:
+            return None
+
+        payload = form.file.payload
+        if not isinstance(payload, bytes):
+            return None
+
+        digest = hashlib.sha256(payload)
+        digest.update(repr(sorted(form._form_dict.items())).encode())
+        return self.cache_dir / f"{digest.hexdigest()}.xml"
+
+    def __cache_lookup(self, cache_path: Path | None) -> Response | None:
+        """Return a cached Response for the path, if one exists."""
+        if cache_path is not None and cache_path.is_file():
+            return Response(
+                status_code=200,
+                content=cache_path.read_bytes(),
+                headers=httpx.Headers(),
+            )
+
+    def __cache_store(self, cache_path: Path | None, response: Response) -> None:
+        """Write a successful response body to the cache."""
+        if cache_path is not None and response.status_code == 200:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(response.content)
+
+    async def __post_aiohttp(self, form: Form) -> Response:
+        """Submit a form over the shared aiohttp session.
+
+        Raises:
+            GrobidClientError: if the request or the response status fails
+        """
+        import aiohttp
+
+        data = aiohttp.FormData()
+        for key, value in form.to_dict().items():
+            if key == "input":
+                file_name, payload, mime_type = value
+                data.add_field(
+                    key, payload, filename=file_name, content_type=mime_type
+                )
+            else:
+                if isinstance(value, bool):
+                    value = "true" if value else "false"
+                data.add_field(key, value)
+
+        session = self._get_aiohttp_session()
+        try:
+            async with session.post(self._url, data=data) as response:
+                content = await response.read()
+                status = response.status
+                headers = httpx.Headers(dict(response.headers))
+        except aiohttp.ClientError:
+            raise GrobidClientError(
+                f"An error occurred while requesting {self._url!r}."
+            )
+
+        res = Response(status_code=status, content=content, headers=headers)
+        try:
+            res.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise GrobidClientError(exc)
+
+        return res
+
     async def asyncio_request(self) -> Response:
         """Request client asynchronously.
 
         Raises:
             GrobidClientError: if httpx.RequestError or httpx.HTTPError is raised
         """
+        cache_path = self.__cache_path(self.form)
+        if (cached := self.__cache_lookup(cache_path)) is not None:
+            return cached
+
+        if self.transport == "aiohttp":
+            res = await self.__post_aiohttp(self.form)
+            self.__cache_store(cache_path, res)
+            return res
+
         kwargs = self.__build_request()
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(**kwargs)
-                return self.__build_response(response)
-            except httpx.RequestError as exc:
-                raise GrobidClientError(
-                    f"An error occurred while requesting {exc.request.url!r}."
-                )
-            except httpx.HTTPError as exc:
-                raise GrobidClientError(exc)
+        client = self._get_async_client()
+        try:
+            response = await client.post(**kwargs)
+            res = self.__build_response(response)
+            self.__cache_store(cache_path, res)
+            return res
+        except httpx.RequestError as exc:
+            raise GrobidClientError(
+                f"An error occurred while requesting {exc.request.url!r}."
+            )
+        except httpx.HTTPError as exc:
+            raise GrobidClientError(exc)
+
+    async def process_many(
+        self, forms: Iterable[Form], concurrency: int = 8
+    ) -> list[Response | BaseException]:
+        """Request many forms concurrently over the shared async client.
+
+        At most 'concurrency' requests are in flight at once. Failed
+        requests are returned as GrobidClientError instances in place of
+        their Response, so one bad PDF does not abort the whole batch.
+
+        Args:
+            forms: forms to submit
+            concurrency: maximum number of in-flight requests. Default is 8.
+
+        Returns:
+            List of Response objects (or GrobidClientError), in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        client = None if self.transport == "aiohttp" else self._get_async_client()
+
+        async def one(form: Form) -> Response:
+            cache_path = self.__cache_path(form)
+            if (cached := self.__cache_lookup(cache_path)) is not None:
+                return cached
+
+            async with semaphore:
+                if self.transport == "aiohttp":
+                    res = await self.__post_aiohttp(form)
+                    self.__cache_store(cache_path, res)
+                    return res
+
+                try:
+                    response = await client.post(**self.__build_request(form))
+                    res = self.__build_response(response)
+                    self.__cache_store(cache_path, res)
+                    return res
+                except httpx.RequestError as exc:
+                    raise GrobidClientError(
+                        f"An error occurred while requesting {exc.request.url!r}."
+                    )
+                except httpx.HTTPError as exc:
+                    raise GrobidClientError(exc)
+
+        return await asyncio.gather(
+            *(one(form) for form in forms), return_exceptions=True
+        )
+
+    @contextlib.contextmanager
+    def sync_stream(self) -> Iterator[httpx.Response]:
+        """Stream the response synchronously instead of buffering it.
+
+        Yields the raw httpx.Response so large TEI XML can be consumed
+        incrementally (e.g. response.iter_bytes() into a SAX parser)
+        without holding the whole document in memory.
+
+        Raises:
+            GrobidClientError: if httpx.RequestError or httpx.HTTPError is raised
+        """
+        kwargs = self.__build_request()
+        client = self._get_sync_client()
+        try:
+            with client.stream("POST", **kwargs) as response:
+                yield response
+        except httpx.RequestError as exc:
+            raise GrobidClientError(
+                f"An error occurred while requesting {exc.request.url!r}."
+            )
+        except httpx.HTTPError as exc:
+            raise GrobidClientError(exc)
+
+    @contextlib.asynccontextmanager
+    async def asyncio_stream(self) -> AsyncIterator[httpx.Response]:
+        """Stream the response asynchronously instead of buffering it.
+
+        Yields the raw httpx.Response so large TEI XML can be consumed
+        incrementally via response.aiter_bytes().
+
+        Raises:
+            GrobidClientError: if httpx.RequestError or httpx.HTTPError is raised
+        """
+        kwargs = self.__build_request()
+        client = self._get_async_client()
+        try:
+            async with client.stream("POST", **kwargs) as response:
+                yield response
+        except httpx.RequestError as exc:
+            raise GrobidClientError(
+                f"An error occurred while requesting {exc.request.url!r}."
+            )
+        except httpx.HTTPError as exc:
+            raise GrobidClientError(exc)
 
     def sync_request(self) -> Response:
         """Request client synchronously.
@@ -90,10 +401,17 @@ class Client:
         Raises:
             GrobidClientError: if httpx.RequestError or httpx.HTTPError is raised
         """
+        cache_path = self.__cache_path(self.form)
+        if (cached := self.__cache_lookup(cache_path)) is not None:
+            return cached
+
         kwargs = self.__build_request()
+        client = self._get_sync_client()
         try:
-            response = httpx.post(**kwargs)
-            return self.__build_response(response)
+            response = client.post(**kwargs)
+            res = self.__build_response(response)
+            self.__cache_store(cache_path, res)
+            return res
         except httpx.RequestError as exc:
             raise GrobidClientError(
                 f"An error occurred while requesting {exc.request.url!r}."
@@ -6,7 +6,7 @@ from grobid.models.json import DataClassJSONMixin
 from grobid.models.section import Section
 
 
-@dataclass
+@dataclass(slots=True)
 class Table(DataClassJSONMixin):
     """Represents the <figure> XML tag of type table."""
 
@@ -15,7 +15,7 @@ class Table(DataClassJSONMixin):
     rows: list[list[str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Article(DataClassJSONMixin):
     """Represents the scholarly article."""
 
@@ -25,3 +25,30 @@ class Article(DataClassJSONMixin):
     sections: list[Section]
     tables: dict[str, Table]
     abstract: Section | None = None
+
+    def __eq__(self, other: object) -> bool:
+        """Compare articles, cheapest checks first.
+
+        Identity and the container lengths are checked before the deep
+        field-by-field compare, so trivially unequal articles never walk
+        their citation and section graphs.
+        """
+        if self is other:
+            return True
+        if other.__class__ is not Article:
+            return NotImplemented
+        if (
+            len(self.sections) != len(other.sections)
+            or len(self.citations) != len(other.citations)
+            or len(self.tables) != len(other.tables)
+            or self.keywords != other.keywords
+        ):
+            return False
+
+        return (
+            self.abstract == other.abstract
+            and self.bibliography == other.bibliography
+            and self.sections == other.sections
+            and self.tables == other.tables
+            and self.citations == other.citations
+        )
@@ -1,18 +1,23 @@
 """Represents a citation, including all the relevant information."""
+import sys
 from dataclasses import dataclass, field
 
 from grobid.models.json import DataClassJSONMixin
 
 
-@dataclass
+@dataclass(slots=True)
 class PageRange(DataClassJSONMixin):
-    """Represents the 'to' and 'from' attributes in <biblScope/> XML tag."""
+    """Represents the 'to' and 'from' attributes in <biblScope/> XML tag.
 
-    from_page: int
-    to_page: int
+    Pages are kept as parsed; GROBID page values are frequently
+    non-numeric ("iv", "e123"), so no int conversion is attempted.
+    """
 
+    from_page: str | int
+    to_page: str | int
 
-@dataclass
+
+@dataclass(slots=True)
 class Scope(DataClassJSONMixin):
     """Represents the <biblScope/> XML tag."""
 
@@ -21,10 +26,10 @@ class Scope(DataClassJSONMixin):
 
     def is_empty(self) -> bool:
         """Return True if the default values are the same."""
-        return all(attr is None for attr in self.__dict__.values())
+        return self.volume is None and self.pages is None
 
 
-@dataclass
+@dataclass(slots=True)
 class Date(DataClassJSONMixin):
     """Represents the 'when' attribute in the <date/> XML tag."""
 
@@ -33,7 +38,7 @@ class Date(DataClassJSONMixin):
     day: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonName(DataClassJSONMixin):
     """Represents the <persName/> XML tag."""
 
@@ -50,7 +55,7 @@ class PersonName(DataClassJSONMixin):
             return f"{self.surname}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Affiliation(DataClassJSONMixin):
     """Represents the <affiliation> XML tag."""
 
@@ -62,10 +67,14 @@ class Affiliation(DataClassJSONMixin):
 
     def is_empty(self) -> bool:
         """Return True if the default values are the same."""
-        return all(attr is None for attr in self.__dict__.values())
+        return (
+            self.department is None
+            and self.institution is None
+            and self.laboratory is None
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Author(DataClassJSONMixin):
     """Represents the <author> XML tag."""
 
@@ -74,7 +83,7 @@ class Author(DataClassJSONMixin):
     email: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CitationIDs(DataClassJSONMixin):
     """Represents the <idno> XML tag."""
 
@@ -86,10 +95,10 @@ class CitationIDs(DataClassJSONMixin):
 
     def is_empty(self) -> bool:
         """Return True if the default values are the same."""
-        return all(attr is None for attr in self.__dict__.values())
+        return self.DOI is None and self.arXiv is None
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation(DataClassJSONMixin):
     """Represents the <biblStruct> XML tag."""
 
@@ -104,3 +113,16 @@ class Citation(DataClassJSONMixin):
     scope: Scope | None = None
     # meeting: str | None = None
     # phone: str | None = None
+
+    def __post_init__(self) -> None:
+        """Intern strings that repeat across a bibliography.
+
+        Journal, series and publisher names recur constantly in large
+        corpora; interning lets duplicates share one string object.
+        """
+        if self.publisher is not None:
+            self.publisher = sys.intern(self.publisher)
+        if self.journal is not None:
+            self.journal = sys.intern(self.journal)
+        if self.series is not None:
+            self.series = sys.intern(self.series)
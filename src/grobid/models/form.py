@@ -1,22 +1,53 @@
 # noqa: D100
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
 
+from httpx._multipart import MultipartStream
 
-@dataclass
+_ENABLED = "1"
+_CONSOLIDATION_LEVELS = {0: "0", 1: "1", 2: "2"}
+
+
+@dataclass(slots=True)
 class File:
-    """Represents the PDF file used as input."""
+    """Represents the PDF file used as input.
+
+    The payload can be raw bytes or an open binary file object; file
+    objects are streamed by httpx so large PDFs are never buffered in
+    memory.
+    """
 
-    payload: bytes
+    payload: bytes | BinaryIO
     file_name: str | None = None
     mime_type: str | None = None
 
-    def to_tuple(self) -> tuple[str | None, bytes, str | None]:
+    @classmethod
+    def from_path(cls, path: Path, mime_type: str | None = "application/pdf") -> "File":
+        """Create a File that streams its payload from disk.
+
+        The caller is responsible for the lifetime of the underlying file
+        object (it is closed when garbage collected).
+
+        Args:
+            path: path to the PDF file
+            mime_type: MIME type of the file. Default is 'application/pdf'.
+
+        Returns:
+            File object with a file-like payload
+        """
+        return cls(
+            payload=open(path, "rb"),
+            file_name=path.name,
+            mime_type=mime_type,
+        )
+
+    def to_tuple(self) -> tuple[str | None, bytes | BinaryIO, str | None]:
         """Return a tuple for httpx mutlipart/form-data encoding."""
         return self.file_name, self.payload, self.mime_type
 
 
-@dataclass
+@dataclass(slots=True)
 class Form:
     """Represents form data accepted by GROBID's processFulltextDocument endpoint."""
 
@@ -28,22 +59,29 @@ class Form:
     include_raw_affiliations: bool | None = None
     tei_coordinates: str | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Return dictionary for multipart/form-data."""
-        form_dict: dict[str, Any] = {}
+    _form_dict: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _prebuilt: tuple[bytes, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-        form_dict["input"] = self.file.to_tuple()
+    def __post_init__(self) -> None:
+        """Precompute the parameter part of the multipart dictionary.
+
+        The parameters are fixed at construction, so the branching only
+        runs once rather than on every request.
+        """
+        form_dict = self._form_dict
 
         if self.segment_sentences:
-            form_dict["segmentSentences"] = "1"
+            form_dict["segmentSentences"] = _ENABLED
 
-        match self.consolidate_header:
-            case (0 | 1 | 2):
-                form_dict["consolidateHeader"] = str(self.consolidate_header)
+        if (level := _CONSOLIDATION_LEVELS.get(self.consolidate_header)) is not None:
+            form_dict["consolidateHeader"] = level
 
-        match self.consolidate_citations:
-            case (0 | 1 | 2):
-                form_dict["consolidateCitations"] = str(self.consolidate_citations)
+        if (level := _CONSOLIDATION_LEVELS.get(self.consolidate_citations)) is not None:
+            form_dict["consolidateCitations"] = level
 
         if self.include_raw_citations is not None:
             form_dict["includeRawCitations"] = self.include_raw_citations
@@ -54,4 +92,38 @@ class Form:
         if self.tei_coordinates is not None:
             form_dict["teiCoordinates"] = self.tei_coordinates
 
-        return form_dict
+    def to_dict(self) -> dict[str, Any]:
+        """Return dictionary for multipart/form-data.
+
+        The 'input' file tuple is rebuilt each call because httpx may
+        consume a file-like payload; the remaining parameters come from
+        the cached dictionary.
+        """
+        return {"input": self.file.to_tuple(), **self._form_dict}
+
+    def prebuild(self) -> tuple[bytes, str]:
+        """Encode the multipart body once for reuse across submissions.
+
+        Useful when the same form is retried or posted to several GROBID
+        replicas: the encoded body and its Content-Type header (which
+        carries the boundary) can be sent with 'content='/'headers='
+        instead of re-encoding 'files=' per request. The result is
+        cached.
+
+        Returns:
+            Tuple of the encoded body and the Content-Type header value
+
+        Raises:
+            ValueError: if the payload is a stream rather than bytes
+        """
+        if not isinstance(self.file.payload, bytes):
+            raise ValueError("prebuild requires a bytes payload")
+
+        if self._prebuilt is None:
+            stream = MultipartStream(
+                data=self._form_dict, files={"input": self.file.to_tuple()}
+            )
+            content_type = stream.get_headers()["Content-Type"]
+            self._prebuilt = (b"".join(stream), content_type)
+
+        return self._prebuilt
@@ -1,4 +1,10 @@
 # noqa: D100
+try:
+    from mashumaro.config import BaseConfig
+    from mashumaro.mixins.orjson import DataClassORJSONMixin
+except ImportError:
+    DataClassORJSONMixin = None  # type: ignore[assignment,misc]
+
 try:
     import orjson
 except ImportError:
@@ -7,31 +13,76 @@ else:
     _has_json = True
 
 
-class DataClassJSONMixin:
-    """Use orjson to serialize dataclasses.dataclass."""
+if DataClassORJSONMixin is not None:
 
-    def to_json(self, decode=True) -> str | bytes:
-        """Attempt to use orjson to serialize dataclasses.dataclass.
+    class DataClassJSONMixin(DataClassORJSONMixin):
+        """Use mashumaro's generated orjson serializer for dataclasses.
 
-        Args:
-            decode: decode utf-8 bytes
+        mashumaro generates specialized to_dict/to_json methods at class
+        creation time, avoiding per-call reflection over the dataclass tree.
+        """
 
-        Returns:
-            JSON either as str or bytes, depending on value of 'decode'
+        __slots__ = ()
 
-        Raises:
-            RuntimeWarning: extra require 'json' not installed
-        """
-        if not _has_json:
-            raise RuntimeWarning(
-                "orjson is not installed. Run 'pip install grobid[json]'"
-            )
-
-        def default(obj):
-            if isinstance(obj, set):
-                return list(obj)
-
-        if decode:
-            return orjson.dumps(self, default=default).decode("utf-8")
-        else:
-            return orjson.dumps(self, default=default)
+        class Config(BaseConfig):
+            """Skip None fields so sparse citations serialize compactly."""
+
+            omit_none = True
+
+        def to_json(self, decode=True) -> str | bytes:  # type: ignore[override]
+            """Serialize dataclasses.dataclass with generated orjson code.
+
+            Args:
+                decode: decode utf-8 bytes
+
+            Returns:
+                JSON either as str or bytes, depending on value of 'decode'
+            """
+            if decode:
+                return super().to_json()
+            else:
+                return self.to_jsonb()
+
+else:
+
+    class DataClassJSONMixin:  # type: ignore[no-redef]
+        """Use orjson to serialize dataclasses.dataclass."""
+
+        __slots__ = ()
+
+        def to_json(self, decode=True) -> str | bytes:
+            """Attempt to use orjson to serialize dataclasses.dataclass.
+
+            Args:
+                decode: decode utf-8 bytes
+
+            Returns:
+                JSON either as str or bytes, depending on value of 'decode'
+
+            Raises:
+                RuntimeWarning: extra require 'json' not installed
+            """
+            if not _has_json:
+                raise RuntimeWarning(
+                    "orjson is not installed. Run 'pip install grobid[json]'"
+                )
+
+            def default(obj):
+                if isinstance(obj, set):
+                    return list(obj)
+
+            if decode:
+                return orjson.dumps(self, default=default).decode("utf-8")
+            else:
+                return orjson.dumps(self, default=default)
+
+        def to_jsonb(self) -> bytes:
+            """Serialize to JSON bytes, skipping the UTF-8 decode.
+
+            Useful for callers that write the payload out directly (e.g.
+            HTTP response bodies).
+
+            Raises:
+                RuntimeWarning: extra require 'json' not installed
+            """
+            return self.to_json(decode=False)  # type: ignore[return-value]
@@ -1,10 +1,17 @@
 # noqa: D100
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from httpx import Headers, HTTPError
 
+_ERROR_MSGS = {
+    203: "Content couldn't be extracted",
+    400: "Wrong request, missing parameters, missing header",
+    500: "Internal service error",
+    503: "Service not available",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class Response:
     """Represents the response from GROBID's processFulltextDocument endpoint."""
 
@@ -12,21 +19,23 @@ class Response:
     content: bytes
     headers: Headers
 
+    _text: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def text(self) -> str:
+        """Return the content decoded as UTF-8.
+
+        The decode happens once and is cached in a slot; mutating
+        'content' afterwards does not invalidate the cache.
+        """
+        if self._text is None:
+            self._text = self.content.decode("utf-8")
+        return self._text
+
     def raise_for_status(self):
         """Only considers GROBID's documented status codes as HTTP errors."""
-        http_error_msg = ""
-
-        match self.status_code:
-            case 203:
-                error_msg = "Content couldn't be extracted"
-            case 400:
-                error_msg = "Wrong request, missing parameters, missing header"
-            case 500:
-                error_msg = "Internal service error"
-            case 503:
-                error_msg = "Service not available"
-            case _:
-                return
-
-        http_error_msg = f"{self.status_code}: {error_msg}"
-        raise HTTPError(http_error_msg)
+        error_msg = _ERROR_MSGS.get(self.status_code)
+        if error_msg is None:
+            return
+
+        raise HTTPError(f"{self.status_code}: {error_msg}")
@@ -1,4 +1,6 @@
 """Represents the text sections in a scholarly article."""
+import sys
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -18,11 +20,12 @@ class Marker(str, Enum):
     formula = "formula"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Ref(DataClassJSONMixin):
     """Represents <ref> XML tag.
 
-    Stores the start and end positions of the reference rather than the text.
+    Stores the start and end positions of the reference rather than the
+    text. Instances are immutable (and therefore hashable).
     """
 
     start: int
@@ -30,8 +33,13 @@ class Ref(DataClassJSONMixin):
     marker: Marker | None = None
     target: str | None = None
 
+    def __post_init__(self) -> None:
+        """Intern the target so repeated callouts share one string."""
+        if self.target is not None:
+            object.__setattr__(self, "target", sys.intern(self.target))
 
-@dataclass
+
+@dataclass(slots=True)
 class RefText(DataClassJSONMixin):
     """Represents the <p> XML tag.
 
@@ -41,36 +49,76 @@ class RefText(DataClassJSONMixin):
     text: str
     refs: list[Ref] = field(default_factory=list)
 
+    _plain_text: str | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serialize": "omit"},
+    )
+    _bounds: array = field(
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serialize": "omit"},
+    )
+
+    def __post_init__(self) -> None:
+        """Flatten ref boundaries into a single int array.
+
+        The hot plain_text loop then reads two ints per ref instead of
+        doing two attribute loads on each Ref object. Boundaries are
+        sorted by start so plain_text stays a single left-to-right
+        splice even if refs were supplied out of document order.
+        """
+        refs = self.refs
+        if any(refs[i].start > refs[i + 1].start for i in range(len(refs) - 1)):
+            refs = sorted(refs, key=lambda ref: ref.start)
+        bounds = array("i")
+        for ref in refs:
+            bounds.append(ref.start)
+            bounds.append(ref.end)
+        self._bounds = bounds
+
     @property
     def plain_text(self) -> str:
         """Return text without any references.
 
-        Trailing whitespace is removed.
+        Trailing whitespace is removed. The result is computed once and
+        cached; mutating 'text' or 'refs' afterwards does not invalidate
+        the cache.
         """
-        if len(self.refs) == 0:
-            return self.text
+        if self._plain_text is not None:
+            return self._plain_text
 
-        ranges = [(ref.start, ref.end) for ref in self.refs]
-        text = ""
+        bounds = self._bounds
+        if len(bounds) == 0:
+            self._plain_text = self.text
+            return self._plain_text
+
+        text = self.text
+        parts = []
         left_bound = 0
-        for start, end in ranges:
-            text += self.text[left_bound:start].rstrip()
-            left_bound = end
-        text += self.text[ranges[-1][1] :].rstrip()
-        return text
+        for i in range(0, len(bounds), 2):
+            parts.append(text[left_bound : bounds[i]].rstrip())
+            left_bound = bounds[i + 1]
+        parts.append(text[left_bound:].rstrip())
+        self._plain_text = "".join(parts)
+        return self._plain_text
 
 
-@dataclass
+@dataclass(slots=True)
 class Section(DataClassJSONMixin):
     """Represents <div> tag with <head> tag."""
 
     title: str
     paragraphs: list[RefText] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Intern the title; section headings repeat across a corpus."""
+        if self.title:
+            self.title = sys.intern(self.title)
+
     def to_str(self) -> str:
         """Return paragraphs in plain text format."""
-        text = ""
-        for paragraph in self.paragraphs:
-            text += paragraph.plain_text
-
-        return text
+        return "".join(paragraph.plain_text for paragraph in self.paragraphs)
@@ -10,11 +10,14 @@ Example::
     article.to_json()  # throws RuntimeError if extra require 'json' not installed
 
 """
-import string
-from typing import Generator
+import functools
+import re
+import sys
+import threading
+from typing import BinaryIO, Generator
 
-from bs4 import BeautifulSoup
-from bs4.element import NavigableString, PageElement, Tag
+from lxml import etree
+from lxml.etree import _Element as Element
 
 from grobid.models import (
     Affiliation,
@@ -33,6 +36,62 @@ from grobid.models import (
 )
 from grobid.models.section import Marker
 
+_PARSER = etree.XMLParser(recover=True, collect_ids=False, huge_tree=True)
+_XML_ID = "{http://www.w3.org/XML/1998/namespace}id"
+_DATE_RE = re.compile(r"^(\d{4})(?:-(\d{1,2}))?(?:-(\d{1,2}))?")
+# orgName type attribute -> Affiliation field
+_ORG_MAP = {
+    "institution": "institution",
+    "department": "department",
+    "laboratory": "laboratory",
+}
+
+
+def _is_mono_case(s: str) -> bool:
+    """Return True if the cased characters are all upper or all lower.
+
+    Equivalent to 's.isupper() or s.islower()' in a single pass that
+    stops at the first mixed-case pair.
+    """
+    upper = lower = True
+    has_cased = False
+    for c in s:
+        if c.isupper():
+            lower = False
+            has_cased = True
+        elif c.islower():
+            upper = False
+            has_cased = True
+        if not (upper or lower):
+            return False
+
+    return has_cased
+
+
+_SELECTORS = threading.local()
+
+
+def _selector(name: str, attrs: tuple[tuple[str, str], ...] = ()) -> etree.XPath:
+    """Compile a descendant-or-self selector once per (name, attrs) pair.
+
+    Compiled XPath objects are cached for the lifetime of the thread, so
+    selectors are tokenized once instead of on every citation or author.
+    The cache is thread-local because lxml XPath evaluators must not be
+    shared between threads.
+    """
+    try:
+        cache = _SELECTORS.compiled
+    except AttributeError:
+        cache = _SELECTORS.compiled = {}
+
+    if (selector := cache.get((name, attrs))) is None:
+        predicates = "".join(f"[@{k}='{v}']" for k, v in attrs)
+        selector = cache[(name, attrs)] = etree.XPath(
+            f"descendant-or-self::{name}{predicates}"
+        )
+
+    return selector
+
 
 class GrobidParserError(BaseException):
     """Exception for Parser class."""
@@ -40,49 +99,114 @@ class GrobidParserError(BaseException):
     pass
 
 
-# NOTE: shouldn't TEI methods be static?
 class Parser:
     """Methods used to parse TEI XML into serializable objects."""
 
-    soup: BeautifulSoup
+    root: Element
 
     def __init__(self, stream: bytes) -> None:
         """TEI class constructor.
 
         Args:
             stream: XML bytes
+
+        Raises:
+            GrobidParserError: stream could not be parsed as XML
         """
-        self.soup = BeautifulSoup(stream, "lxml-xml")
+        try:
+            root = etree.fromstring(stream, _PARSER)
+        except etree.XMLSyntaxError:
+            # even with recover=True, fromstring raises on empty input
+            root = None
+        if root is None:
+            raise GrobidParserError("Invalid XML")
+
+        self._strip_namespace(root)
+
+        # The parser only reads body, abstract, keywords, sourceDesc and
+        # listBibl; drop the subtrees it never touches (coordinate data
+        # in facsimile can dominate memory on large documents).
+        for el in list(root.iter("facsimile", "encodingDesc")):
+            if (parent := el.getparent()) is not None:
+                parent.remove(el)
+
+        self.root = root
+
+    @property
+    def soup(self) -> Element:
+        """Alias for the document root (kept from the bs4 implementation)."""
+        return self.root
+
+    @staticmethod
+    def _strip_namespace(root: Element) -> None:
+        # GROBID output uses a default TEI namespace; strip it once so
+        # lookups match on local names, as the previous bs4 parser did.
+        # The local names are interned: the TEI vocabulary is a small
+        # fixed set repeated thousands of times, and interning makes the
+        # tag comparisons in the hot dispatch loops pointer checks.
+        tag = root.tag
+        if isinstance(tag, str) and tag.startswith("{"):
+            intern = sys.intern
+            for el in root.iter():
+                tag = el.tag
+                if isinstance(tag, str) and "}" in tag:
+                    el.tag = intern(tag.rpartition("}")[2])
+
+    @staticmethod
+    def _find(
+        source_tag: Element, name: str, attrs: dict[str, str] | None = None
+    ) -> Element | None:
+        # First descendant-or-self element with the name and attributes
+        found = _selector(name, tuple(attrs.items()) if attrs else ())(source_tag)
+        return found[0] if found else None
 
-    def __parse_date(self, date: str) -> Date | None:
+    @staticmethod
+    def _find_all(source_tag: Element, name: str) -> list[Element]:
+        # All descendant-or-self elements with the name
+        return _selector(name)(source_tag)
+
+    @staticmethod
+    def _text(source_tag: Element) -> str:
+        # Concatenated descendant text, like bs4's Tag.text; flat
+        # elements (heads, cells, idnos, ...) skip the subtree walk
+        if len(source_tag) == 0:
+            return source_tag.text or ""
+        return "".join(source_tag.itertext())
+
+    @staticmethod
+    def __parse_date(date: str) -> Date | None:
         # Naive ISO 8601 date parser
-        tokens = date.split(sep="-")
-        tokens = list(filter(None, tokens))
+        if (match := _DATE_RE.match(date)) is None:
+            return
 
-        match len(tokens):
-            case 0:
-                return
-            case 1:
-                year = tokens[0]
-                return Date(year)
-            case 2:
-                year, month = tokens
-                return Date(year, month)
-            case _:
-                year, month, day = tokens[0:3]
-                return Date(year, month, day)
+        year, month, day = match.groups()
+        if day:
+            return Date(year, month, day)
+        if month:
+            return Date(year, month)
+        return Date(year)
 
     def __text_and_refs(
         self,
-        source_tag: Tag,
-    ) -> Generator[PageElement, str, None]:
-        # Generator with both NavigableStrings and ref Tags
-        for descendant in source_tag.descendants:
-            descendant_type = type(descendant)
-            if descendant_type is Tag and descendant.name == "ref":  # type: ignore
-                yield descendant
-            elif descendant_type is NavigableString:
-                yield descendant
+        source_tag: Element,
+    ) -> Generator[tuple[Element, str] | str, None, None]:
+        # Generator with text strings and (ref Element, ref text) pairs
+        # in document order; pairing the text with its element means the
+        # ref subtree is only walked once
+        if (text := source_tag.text) is not None:
+            yield text
+        for child in source_tag:
+            tag = child.tag
+            if tag == "ref":
+                yield child, "".join(child.itertext())
+            elif type(tag) is str:  # skip comments/processing instructions
+                if len(child):
+                    yield from self.__text_and_refs(child)
+                elif (text := child.text) is not None:
+                    # childless elements need no recursive frame
+                    yield text
+            if (tail := child.tail) is not None:
+                yield tail
 
     def parse(self) -> Article:
         """Attempt to parse the XML into Article object.
@@ -95,45 +219,152 @@ class Parser:
         Raises:
             GrobidParserError: Article could not be parsed
         """
-        body = self.soup.body
-
-        if not isinstance(body, Tag):
+        # One walk over the document finds every top-level tag parse()
+        # needs, instead of an independent scan per tag.
+        body = abstract_tag = source = keywords_tag = listbibl_tag = None
+        for el in self.root.iter(
+            "body", "abstract", "sourceDesc", "keywords", "listBibl"
+        ):
+            match el.tag:
+                case "body" if body is None:
+                    body = el
+                case "abstract" if abstract_tag is None:
+                    abstract_tag = el
+                case "sourceDesc" if source is None:
+                    source = el
+                case "keywords" if keywords_tag is None:
+                    keywords_tag = el
+                case "listBibl" if listbibl_tag is None:
+                    listbibl_tag = el
+
+        if body is None:
             raise GrobidParserError("Missing body")
 
-        abstract: Section | None = self.section(self.soup.abstract, title="Abstract")
+        if source is None:
+            raise GrobidParserError("Missing source description")
 
-        sections: list[Section] = []
-        for div in body.find_all("div"):
-            if (section := self.section(div)) is not None:
-                sections.append(section)
+        biblstruct_tag = self._find(source, "biblStruct")
+        if biblstruct_tag is None:
+            raise GrobidParserError("Missing bibliography")
+
+        if listbibl_tag is None:
+            raise GrobidParserError("Missing citations")
+
+        sections, tables = self.__parse_body(body)
+
+        return Article(
+            abstract=self.section(abstract_tag, title="Abstract"),
+            sections=sections,
+            tables=tables,
+            bibliography=self.citation(biblstruct_tag),
+            keywords=self.keywords(keywords_tag),
+            citations=self.__parse_citations(listbibl_tag),
+        )
 
+    def __parse_body(self, body: Element) -> tuple[list[Section], dict[str, Table]]:
+        # Sections and tables come from a single body walk
+        sections: list[Section] = []
         tables: dict[str, Table] = {}
-        for table_tag in body.find_all("figure", {"type": "table"}):
-            if isinstance(table_tag, Tag):
-                if "xml:id" in table_tag.attrs:
-                    name = table_tag.attrs["xml:id"]
-                    if (table_obj := self.table(table_tag)) is not None:
+        for el in body.iter("div", "figure"):
+            if el.tag == "div":
+                if (section := self.section(el)) is not None:
+                    sections.append(section)
+            elif el.get("type") == "table":
+                if (name := el.get(_XML_ID)) is not None:
+                    if (table_obj := self.table(el)) is not None:
                         tables[name] = table_obj
 
-        if (source := self.soup.find("sourceDesc")) is None:
-            raise GrobidParserError("Missing source description")
+        return sections, tables
 
-        biblstruct_tag = source.find("biblStruct")
-        if not isinstance(biblstruct_tag, Tag):
-            raise GrobidParserError("Missing bibliography")
+    def __parse_citations(self, listbibl_tag: Element) -> dict[str | None, Citation]:
+        citations: dict[str | None, Citation] = {}
+        for struct_tag in self._find_all(listbibl_tag, "biblStruct"):
+            citations[struct_tag.get(_XML_ID)] = self.citation(struct_tag)
 
-        bibliography = self.citation(biblstruct_tag)
-        keywords = self.keywords(self.soup.keywords)
+        return citations
 
-        listbibl_tag = self.soup.find("listBibl")
-        if not isinstance(listbibl_tag, Tag):
-            raise GrobidParserError("Missing citations")
+    @classmethod
+    def parse_stream(cls, stream: BinaryIO) -> Article:
+        """Parse TEI XML from a binary stream with bounded memory.
+
+        Unlike Parser(...).parse(), the document is never fully resident:
+        each top-level unit (body, abstract, sourceDesc, keywords,
+        listBibl) is extracted as its end tag arrives and freed before
+        the next one is read, so memory is bounded by the largest unit
+        rather than the document size.
 
-        citations = {}
-        for struct_tag in listbibl_tag.find_all("biblStruct"):
-            if isinstance(struct_tag, Tag):
-                name = struct_tag.get("xml:id")
-                citations[name] = self.citation(struct_tag)
+        Args:
+            stream: binary file-like object with TEI XML
+
+        Returns:
+            Article object
+
+        Raises:
+            GrobidParserError: Article could not be parsed
+        """
+        # Helpers are stateless, so an instance without a DOM root works
+        self = cls.__new__(cls)
+
+        body_seen = source_seen = keywords_seen = False
+        abstract: Section | None = None
+        sections: list[Section] = []
+        tables: dict[str, Table] = {}
+        bibliography: Citation | None = None
+        keywords: set[str] = set()
+        citations: dict[str | None, Citation] | None = None
+
+        for _, el in etree.iterparse(
+            stream, events=("end",), recover=True, huge_tree=True
+        ):
+            tag = el.tag
+            if not isinstance(tag, str):
+                continue
+
+            match tag.rpartition("}")[2]:
+                case "abstract" if abstract is None:
+                    cls._strip_namespace(el)
+                    abstract = self.section(el, title="Abstract")
+                case "body" if not body_seen:
+                    body_seen = True
+                    cls._strip_namespace(el)
+                    for sub in el.iter("div", "figure"):
+                        if sub.tag == "div":
+                            if (section := self.section(sub)) is not None:
+                                sections.append(section)
+                        elif sub.get("type") == "table":
+                            if (name := sub.get(_XML_ID)) is not None:
+                                if (table_obj := self.table(sub)) is not None:
+                                    tables[name] = table_obj
+                case "sourceDesc" if not source_seen:
+                    source_seen = True
+                    cls._strip_namespace(el)
+                    if (struct_tag := self._find(el, "biblStruct")) is not None:
+                        bibliography = self.citation(struct_tag)
+                case "keywords" if not keywords_seen:
+                    keywords_seen = True
+                    cls._strip_namespace(el)
+                    keywords = self.keywords(el)
+                case "listBibl" if citations is None:
+                    cls._strip_namespace(el)
+                    citations = {}
+                    for struct_tag in self._find_all(el, "biblStruct"):
+                        citations[struct_tag.get(_XML_ID)] = self.citation(struct_tag)
+                case _:
+                    continue
+
+            # Free the handled subtree and any preceding siblings
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+
+        if not body_seen:
+            raise GrobidParserError("Missing body")
+        if not source_seen:
+            raise GrobidParserError("Missing source description")
+        if bibliography is None:
+            raise GrobidParserError("Missing bibliography")
+        if citations is None:
+            raise GrobidParserError("Missing citations")
 
         return Article(
             abstract=abstract,
@@ -144,46 +375,98 @@ class Parser:
             citations=citations,
         )
 
-    def citation(self, source_tag: Tag) -> Citation:
+    def citation(self, source_tag: Element) -> Citation:
         """Parse citation.
 
         Args:
-            source_tag : biblStruct XML Tag
+            source_tag : biblStruct XML element
 
         Returns:
             Citation object
         """
-        title = self.title(source_tag, attrs={"type": "main"})
-        if not title:
+        # One walk over the biblStruct collects every tag the citation
+        # needs, instead of an independent selector scan per field
+        title_main = title_m = title_j = title_s = None
+        doi_tag = arxiv_tag = date_tag = ptr_tag = publisher_tag = None
+        scope_tags: list[Element] = []
+        author_tags: list[Element] = []
+
+        for el in source_tag.iter(
+            "title", "idno", "date", "ptr", "publisher", "biblScope", "author"
+        ):
+            match el.tag:
+                case "title":
+                    if title_main is None and el.get("type") == "main":
+                        title_main = el
+                    match el.get("level"):
+                        case "m" if title_m is None:
+                            title_m = el
+                        case "j" if title_j is None:
+                            title_j = el
+                        case "s" if title_s is None:
+                            title_s = el
+                case "idno":
+                    match el.get("type"):
+                        case "DOI" if doi_tag is None:
+                            doi_tag = el
+                        case "arXiv" if arxiv_tag is None:
+                            arxiv_tag = el
+                case "date" if date_tag is None:
+                    date_tag = el
+                case "ptr" if ptr_tag is None:
+                    ptr_tag = el
+                case "publisher" if publisher_tag is None:
+                    publisher_tag = el
+                case "biblScope":
+                    scope_tags.append(el)
+                case "author":
+                    author_tags.append(el)
+
+        title = self._text(title_main) if title_main is not None else ""
+        if not title and title_m is not None:
             # Use meeting as the main title
-            title = self.title(source_tag, attrs={"level": "m"})
-        citation = Citation(title=title)
-        citation.authors = self.authors(source_tag)
-        ids = CitationIDs(
-            DOI=self.idno(source_tag, attrs={"type": "DOI"}),
-            arXiv=self.idno(source_tag, attrs={"type": "arXiv"}),
+            title = self._text(title_m)
+
+        ids: CitationIDs | None = CitationIDs(
+            DOI=self._text(doi_tag) or None if doi_tag is not None else None,
+            arXiv=self._text(arxiv_tag) or None if arxiv_tag is not None else None,
+        )
+        if ids.is_empty():
+            ids = None
+
+        journal = self._text(title_j) or None if title_j is not None else None
+        if journal == title:
+            journal = None
+        series = self._text(title_s) or None if title_s is not None else None
+        if series == title:
+            series = None
+
+        date: Date | None = None
+        if date_tag is not None and (when := date_tag.get("when")) is not None:
+            date = self.__parse_date(when)
+
+        publisher = None
+        if publisher_tag is not None:
+            publisher = self._text(publisher_tag) or None
+
+        return Citation(
+            title=title,
+            authors=self._authors_from(author_tags),
+            date=date,
+            ids=ids,
+            target=ptr_tag.get("target") if ptr_tag is not None else None,
+            publisher=publisher,
+            journal=journal,
+            series=series,
+            scope=self._scope_from(scope_tags),
         )
-        if not ids.is_empty():
-            citation.ids = ids
-
-        citation.date = self.date(source_tag)
-        citation.target = self.target(source_tag)
-        citation.publisher = self.publisher(source_tag)
-        citation.scope = self.scope(source_tag)
-        if journal := self.title(source_tag, attrs={"level": "j"}):
-            if journal != citation.title:
-                citation.journal = journal
-        if series := self.title(source_tag, attrs={"level": "s"}):
-            if series != citation.title:
-                citation.series = series
-
-        return citation
-
-    def title(self, source_tag: Tag | None, attrs: dict[str, str] = {}) -> str:
+
+    @staticmethod
+    def title(source_tag: Element | None, attrs: dict[str, str] = {}) -> str:
         """Parse title tag text.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
             attrs: dictionary of filters on attribute values. Default is empty dict.
 
         Returns:
@@ -191,45 +474,47 @@ class Parser:
         """
         title: str = ""
         if source_tag is not None:
-            if (title_tag := source_tag.find("title", attrs=attrs)) is not None:
-                title = title_tag.text
+            if (title_tag := Parser._find(source_tag, "title", attrs)) is not None:
+                title = Parser._text(title_tag)
 
         return title
 
-    def target(self, source_tag: Tag | None) -> str | None:
+    @staticmethod
+    def target(source_tag: Element | None) -> str | None:
         """Parse ptr tag target.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
 
         Returns:
             Target location in ptr tag if it exists
         """
         if source_tag is not None:
-            if (ptr_tag := source_tag.ptr) is not None:
-                if "target" in ptr_tag.attrs:
-                    # TODO: validate URL
-                    return ptr_tag.attrs["target"]
+            if (ptr_tag := Parser._find(source_tag, "ptr")) is not None:
+                # TODO: validate URL
+                return ptr_tag.get("target")
 
-    def idno(self, source_tag: Tag | None, attrs: dict[str, str] = {}) -> str | None:
+    @staticmethod
+    def idno(source_tag: Element | None, attrs: dict[str, str] = {}) -> str | None:
         """Parse idno tag.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
             attrs: dictionary of filters on attribute values. Default is empty dict.
 
         Returns:
-            Text content of idno_tag if it exists
+            Text content of idno tag if it exists
         """
         if source_tag is not None:
-            if (idno_tag := source_tag.find("idno", attrs=attrs)) is not None:
-                return idno_tag.text or None
+            if (idno_tag := Parser._find(source_tag, "idno", attrs)) is not None:
+                return Parser._text(idno_tag) or None
 
-    def keywords(self, source_tag: Tag | None) -> set[str]:
+    @staticmethod
+    def keywords(source_tag: Element | None) -> set[str]:
         """Parse all term tags.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
 
         Returns:
             Set of keywords
@@ -237,123 +522,127 @@ class Parser:
         keywords: set[str] = set()
 
         if source_tag is not None:
-            for term_tag in source_tag.find_all("term"):
-                if term_tag.text:
-                    if clean_keyword := self.clean_title_string(term_tag.text):
+            for term_tag in Parser._find_all(source_tag, "term"):
+                if text := Parser._text(term_tag):
+                    if clean_keyword := Parser.clean_title_string(text):
                         keywords.add(clean_keyword)
 
         return keywords
 
-    def publisher(self, source_tag: Tag | None) -> str | None:
+    @staticmethod
+    def publisher(source_tag: Element | None) -> str | None:
         """Parse publisher tag text.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
 
         Returns:
             Text in publisher tag if it exists
         """
         if source_tag is not None:
-            if (publisher_tag := source_tag.find("publisher")) is not None:
-                return publisher_tag.text or None
+            if (publisher_tag := Parser._find(source_tag, "publisher")) is not None:
+                return Parser._text(publisher_tag) or None
 
-    def date(self, source_tag: Tag | None) -> Date | None:
+    @staticmethod
+    def date(source_tag: Element | None) -> Date | None:
         """Parse date tag.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
 
         Returns:
             Date object if date tag is valid
         """
         if source_tag is not None:
-            if (date_tag := source_tag.date) is not None:
-                if "when" in date_tag.attrs:
-                    when = date_tag.attrs["when"]
+            if (date_tag := Parser._find(source_tag, "date")) is not None:
+                if (when := date_tag.get("when")) is not None:
+                    return Parser.__parse_date(when)
 
-                    return self.__parse_date(when)
-
-    def scope(self, source_tag: Tag | None) -> Scope | None:
+    @staticmethod
+    def scope(source_tag: Element | None) -> Scope | None:
         """Parse all biblScope tags.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
 
         Returns:
             Scope object if biblScope tags exist
         """
         if source_tag is not None:
-            scope = Scope()
-            for scope_tag in source_tag.find_all("biblScope"):
-                match scope_tag.attrs["unit"]:
-                    case "page":
-                        try:
-                            if "from" in scope_tag.attrs and "to" in scope_tag.attrs:
-                                from_page = int(scope_tag["from"])
-                                to_page = int(scope_tag["to"])
-                            elif scope_tag.text:
-                                from_page = int(scope_tag.text)
-                                to_page = from_page
-                            else:
-                                continue
-
-                            scope.pages = PageRange(
-                                from_page=from_page, to_page=to_page
-                            )
-                        except ValueError:
-                            continue
-                    case "volume":
-                        try:
-                            volume = int(scope_tag.text)
-                            scope.volume = volume
-                        except ValueError:
-                            continue
+            return Parser._scope_from(Parser._find_all(source_tag, "biblScope"))
 
-            if not scope.is_empty():
-                return scope
-
-    def authors(self, source_tag: Tag | None) -> list[Author]:
+    @staticmethod
+    def _scope_from(scope_tags: list[Element]) -> Scope | None:
+        # Build a Scope from already-collected biblScope tags
+        scope = Scope()
+        for scope_tag in scope_tags:
+            unit = scope_tag.get("unit")
+            if unit == "page":
+                from_page = scope_tag.get("from")
+                to_page = scope_tag.get("to")
+                if from_page is None or to_page is None:
+                    if text := Parser._text(scope_tag):
+                        from_page = to_page = text
+                    else:
+                        continue
+
+                scope.pages = PageRange(from_page=from_page, to_page=to_page)
+            elif unit == "volume":
+                try:
+                    scope.volume = int(Parser._text(scope_tag))
+                except ValueError:
+                    continue
+
+        if not scope.is_empty():
+            return scope
+
+    def authors(self, source_tag: Element | None) -> list[Author]:
         """Parse all author tags.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
 
         Returns:
             List of Author objects
         """
+        if source_tag is None:
+            return []
+
+        return self._authors_from(self._find_all(source_tag, "author"))
+
+    def _authors_from(self, author_tags: list[Element]) -> list[Author]:
+        # Build Author objects from already-collected author tags
         authors: list[Author] = []
-        if source_tag is not None:
-            for author in source_tag.find_all("author"):
-                author_obj: Author | None = None
-                if (persname := author.find("persName")) is not None:
-                    if (surname_tag := persname.find("surname")) is not None:
-                        person_name = PersonName(surname=surname_tag.text)
-                        if forename_tag := persname.find("forename", {"type": "first"}):
-                            person_name.first_name = forename_tag.text
-
-                        author_obj = Author(person_name=person_name)
-                        authors.append(author_obj)
-
-                        if email_tag := author.find("email"):
-                            author_obj.email = email_tag.text
-
-                        for affiliation_tag in author.find_all("affiliation"):
-                            affiliation_obj = Affiliation()
-                            for orgname_tag in affiliation_tag.find_all("orgName"):
-                                match orgname_tag["type"]:
-                                    case "institution":
-                                        affiliation_obj.institution = orgname_tag.text
-                                    case "department":
-                                        affiliation_obj.department = orgname_tag.text
-                                    case "laboratory":
-                                        affiliation_obj.laboratory = orgname_tag.text
-
-                            if not affiliation_obj.is_empty():
-                                author_obj.affiliations.append(affiliation_obj)
+        for author in author_tags:
+            author_obj: Author | None = None
+            if (persname := self._find(author, "persName")) is not None:
+                if (surname_tag := self._find(persname, "surname")) is not None:
+                    person_name = PersonName(surname=self._text(surname_tag))
+                    forename_tag = self._find(persname, "forename", {"type": "first"})
+                    if forename_tag is not None:
+                        person_name.first_name = self._text(forename_tag)
+
+                    author_obj = Author(person_name=person_name)
+                    authors.append(author_obj)
+
+                    if (email_tag := self._find(author, "email")) is not None:
+                        author_obj.email = self._text(email_tag)
+
+                    for affiliation_tag in self._find_all(author, "affiliation"):
+                        affiliation_obj = Affiliation()
+                        for orgname_tag in self._find_all(affiliation_tag, "orgName"):
+                            attr = _ORG_MAP.get(orgname_tag.get("type"))
+                            if attr is not None:
+                                setattr(
+                                    affiliation_obj, attr, self._text(orgname_tag)
+                                )
+
+                        if not affiliation_obj.is_empty():
+                            author_obj.affiliations.append(affiliation_obj)
 
         return authors
 
-    def section(self, source_tag: Tag | None, title: str = "") -> Section | None:
+    def section(self, source_tag: Element | None, title: str = "") -> Section | None:
         """Parse div tag with head tag.
 
         Capitalizes title if not already.
@@ -361,18 +650,18 @@ class Parser:
         Section can have an empty body.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
             title: forces the parsing of the section. Default is empty string (false)
 
         Returns:
             Section object if valid section.
         """
         if source_tag is not None:
-            head = source_tag.find("head")
-            if isinstance(head, Tag):
-                head_text: str = head.get_text()
-                if "n" in head.attrs or head_text[0] in string.ascii_letters:
-                    if head_text.isupper() or head_text.islower():
+            head = self._find(source_tag, "head")
+            if head is not None:
+                head_text: str = self._text(head)
+                if head.get("n") is not None or head_text[:1].isalpha():
+                    if _is_mono_case(head_text):
                         head_text = head_text.capitalize()
 
                 section = Section(title=head_text)
@@ -381,75 +670,82 @@ class Parser:
             else:
                 return
 
-            paragraphs = source_tag.find_all("p")
-            for p in paragraphs:
-                if p and (ref_text := self.ref_text(p)) is not None:
+            for p in self._find_all(source_tag, "p"):
+                if (ref_text := self.ref_text(p)) is not None:
                     section.paragraphs.append(ref_text)
 
             return section
 
-    def ref_text(self, source_tag: Tag | None) -> RefText | None:
+    def ref_text(self, source_tag: Element | None) -> RefText | None:
         """Parse text with ref tags.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
 
         Returns:
             RefText object
         """
         if source_tag is not None:
-            text_and_refs = self.__text_and_refs(source_tag)
-            start = 0
-            ref_text = RefText(text="")
-            for el in text_and_refs:
-                start = len(ref_text.text)
-                if isinstance(el, Tag):
-                    end = start + len(el.text)
-                    ref = Ref(start=start, end=end)
-                    if (el_type := el.attrs.get("type")) is not None:
+            parts: list[str] = []
+            length = 0
+            refs: list[Ref] = []
+            for el in self.__text_and_refs(source_tag):
+                if isinstance(el, str):
+                    parts.append(el)
+                    length += len(el)
+                else:
+                    ref_tag, ref_str = el
+                    start = length
+                    length += len(ref_str)
+                    parts.append(ref_str)
+                    end = length
+                    marker: Marker | None = None
+                    if (el_type := ref_tag.get("type")) is not None:
                         try:
-                            ref.marker = Marker[el_type]
+                            marker = Marker[el_type]
                         except KeyError:
                             pass
 
                     # NOTE: if target[0] is '#', check for citation
-                    if (el_target := el.attrs.get("target")) is not None:
-                        ref.target = el_target
+                    el_target = ref_tag.get("target")
 
-                    ref_text.refs.append(ref)
-                else:
-                    ref_text.text += str(el)
+                    refs.append(
+                        Ref(start=start, end=end, marker=marker, target=el_target)
+                    )
 
-            return ref_text
+            return RefText(text="".join(parts), refs=refs)
 
-    def table(self, source_tag: Tag | None) -> Table | None:
+    def table(self, source_tag: Element | None) -> Table | None:
         """Parse <figure> with table type.
 
         Args:
-            source_tag : XML tag
+            source_tag : XML element
 
         Returns:
             Table object
         """
         if source_tag is not None:
-            if (head_tag := source_tag.find("head")) is not None:
-                if head_text := head_tag.get_text():
+            if (head_tag := self._find(source_tag, "head")) is not None:
+                if head_text := self._text(head_tag):
                     table = Table(heading=head_text)
-                    if (desc_tag := source_tag.find("figDesc")) is not None:
-                        table.description = desc_tag.get_text()
-                    rows = source_tag.find_all("row")
-                    for row in rows:
+                    if (desc_tag := self._find(source_tag, "figDesc")) is not None:
+                        table.description = self._text(desc_tag)
+                    for row in self._find_all(source_tag, "row"):
                         row_list = []
-                        for cell in row.find_all("cell"):
-                            row_list.append(cell.get_text())
+                        for cell in self._find_all(row, "cell"):
+                            row_list.append(self._text(cell))
                         table.rows.append(row_list)
 
                     return table
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def clean_title_string(s: str) -> str:
         """Remove non-alpha leading characters from string.
 
+        Results are memoized: documents repeat identical short titles
+        (journal names, section heads) across citations.
+
         Args:
             s : title string
 
@@ -457,8 +753,10 @@ class Parser:
             Clean title string
         """
         s = s.strip()
-
-        while s and not s[0].isalpha():
-            s = s[1:]
-
-        return s.capitalize()
+        # Leading strip of a single character class needs no regex; the
+        # common case (already clean) is a single isalpha check.
+        i = 0
+        n = len(s)
+        while i < n and not s[i].isalpha():
+            i += 1
+        return s[i:].capitalize()
@@ -116,6 +116,73 @@ class TestClient:
         r = await c.asyncio_request()
         assert r.status_code == 200
 
+    @respx.mock
+    def test_cache_dir(self, tmp_path):
+        """Second request for the same payload is served from disk."""
+        base_url = "http://validurl:8070"
+        c = Client(
+            base_url=base_url, form=self.form, timeout=self.timeout, cache_dir=tmp_path
+        )
+
+        route = respx.mock.post(base_url).mock(
+            return_value=httpx.Response(200, content=b"<TEI/>")
+        )
+
+        assert c.sync_request().content == b"<TEI/>"
+        assert c.sync_request().content == b"<TEI/>"
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_sync_stream(self):
+        """Test synchronous streaming response."""
+        base_url = "http://validurl:8070"
+        c = Client(base_url=base_url, form=self.form, timeout=self.timeout)
+
+        respx.mock.post(base_url).mock(
+            return_value=httpx.Response(200, content=b"<TEI/>")
+        )
+        with c.sync_stream() as response:
+            assert response.status_code == 200
+            assert b"".join(response.iter_bytes()) == b"<TEI/>"
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_asyncio_stream(self):
+        """Test asynchronous streaming response."""
+        base_url = "http://validurl:8070"
+        c = Client(base_url=base_url, form=self.form, timeout=self.timeout)
+
+        respx.mock.post(base_url).mock(
+            return_value=httpx.Response(200, content=b"<TEI/>")
+        )
+        async with c.asyncio_stream() as response:
+            assert response.status_code == 200
+            content = b"".join([chunk async for chunk in response.aiter_bytes()])
+            assert content == b"<TEI/>"
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_process_many(self):
+        """Test concurrent batch requests."""
+        base_url = "http://validurl:8070"
+        c = Client(base_url=base_url, form=self.form, timeout=self.timeout)
+
+        respx.mock.post(base_url).mock(
+            side_effect=[
+                httpx.Response(200),
+                httpx.Response(200),
+                httpx.Response(503),
+            ]
+        )
+        responses = await c.process_many([self.form] * 3)
+
+        assert len(responses) == 3
+        errors = [r for r in responses if isinstance(r, GrobidClientError)]
+        assert len(errors) == 1
+        assert all(
+            r.status_code == 200 for r in responses if not isinstance(r, BaseException)
+        )
+
     @pytest.mark.asyncio
     async def test_asyncio_invalid_request(self):
         """Test invalid URL asynchronously."""
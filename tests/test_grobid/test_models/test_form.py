@@ -2,6 +2,7 @@
 
 
 import fitz
+import pytest
 
 from grobid.models.form import File, Form
 
@@ -86,3 +87,34 @@ class TestFile:
         file: File = File(test_obj, file_name=file_name, mime_type=mime_type)
 
         assert file.to_tuple() == (file_name, test_obj, mime_type)
+
+    def test_prebuild(self):
+        """Multipart body is encoded once and cached."""
+        file = File(test_obj, file_name="test", mime_type="application/pdf")
+        form: Form = Form(file, segment_sentences=True)
+
+        body, content_type = form.prebuild()
+        assert test_obj in body
+        assert content_type.startswith("multipart/form-data; boundary=")
+        assert form.prebuild() == (body, content_type)
+
+    def test_prebuild_stream_payload(self, tmp_path):
+        """File-like payloads cannot be pre-encoded."""
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(test_obj)
+        form: Form = Form(File.from_path(pdf_path))
+
+        with pytest.raises(ValueError, match="bytes payload"):
+            form.prebuild()
+
+    def test_from_path(self, tmp_path):
+        """Payload from a path is a file object streamed by httpx."""
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(test_obj)
+        file: File = File.from_path(pdf_path)
+
+        file_name, payload, mime_type = file.to_tuple()
+        assert file_name == "test.pdf"
+        assert payload.read() == test_obj
+        assert mime_type == "application/pdf"
+        payload.close()
@@ -20,6 +20,7 @@ class TestDataClassJSONMixin:  # noqa: D101
         if "orjson" in sys.modules:
             assert self.obj.to_json(decode=True) == '{"test":[]}'
             assert self.obj.to_json(decode=False) == b'{"test":[]}'
+            assert self.obj.to_jsonb() == b'{"test":[]}'
 
     def test_orjson_not_available(self):  # noqa: D102
         if "orjson" not in sys.modules:
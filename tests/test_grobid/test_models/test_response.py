@@ -0,0 +1,15 @@
+"""Unit tests for the response module."""
+from httpx import Headers
+
+from grobid.models.response import Response
+
+
+class TestResponse:
+    """Unit tests for Response class."""
+
+    def test_text(self):
+        """Content is decoded as UTF-8 and cached."""
+        response = Response(status_code=200, content=b"<TEI/>", headers=Headers())
+
+        assert response.text == "<TEI/>"
+        assert response.text is response.text
@@ -1,4 +1,8 @@
 """Unit tests for the TEI class."""
+import dataclasses
+import io
+from functools import lru_cache
+
 import pytest
 
 from grobid.models import (
@@ -20,33 +24,89 @@ from grobid.models import (
 from grobid.tei import GrobidParserError, Parser
 
 
+@pytest.fixture(scope="session")
+def parser_factory():
+    """Cache Parser instances across tests for repeated XML inputs.
+
+    Parser never mutates its tree after construction, so tests that
+    share canned XML can share one instance.
+    """
+    return lru_cache(maxsize=None)(Parser)
+
+
+@pytest.fixture(scope="session")
+def large_article():
+    """An Article with many sections and citations, built once per session."""
+    return Article(
+        bibliography=Citation(
+            title="Test",
+            authors=[Author(PersonName("Doe", "John"))],
+        ),
+        keywords=set(),
+        tables=dict(test=Table(heading="Test", rows=[["Foo", "Bar"]])),
+        sections=[
+            Section(f"Section {i}", [RefText(f"Lorem ipsum {i}")]) for i in range(20)
+        ],
+        citations={
+            f"b{i}": Citation(
+                title=f"Title {i}",
+                authors=[Author(PersonName("Doe", f"Jane {i}"))],
+            )
+            for i in range(50)
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def large_article_xml(large_article):
+    """Serialized XML for the large article, shared across parse tests."""
+    return TestParse.build_xml(large_article)
+
+
+# Literal fragments shared by the build_xml helpers
+_TEI_OPEN = b"<TEI><sourceDesc>"
+_BODY_OPEN = b"</sourceDesc><body>"
+_LISTBIBL_OPEN = b"</body><listBibl>"
+_TEI_CLOSE = b"</listBibl></TEI>"
+_ANALYTIC_OPEN = b"<analytic>"
+_ANALYTIC_CLOSE = b"</analytic>"
+_AUTHOR_OPEN = b"<author><persName>"
+_PERSNAME_CLOSE = b"</persName>"
+_AFFILIATION_OPEN = b"<affiliation>"
+_AUTHOR_CLOSE = b"</affiliation></author>"
+_ROW_OPEN = b"<row>"
+_ROW_CLOSE = b"</row>"
+
+# Field names used when serializing models back to XML; computed once
+# instead of reflecting over instance __dict__ per fixture build
+_ID_FIELDS = tuple(f.name for f in dataclasses.fields(CitationIDs))
+_SCOPE_FIELDS = tuple(f.name for f in dataclasses.fields(Scope))
+_AFFILIATION_FIELDS = tuple(f.name for f in dataclasses.fields(Affiliation))
+
+
 class TestParse:
     """Unit tests for parse function."""
 
     @staticmethod
     def build_xml(article: Article) -> bytes:
         """Create XML from Article object."""
-        tei_tags: list[bytes] = [b"<TEI>"]
-
-        tei_tags.append(b"<sourceDesc>")
-        tei_tags.append(TestCitation.build_xml(article.bibliography))
-        tei_tags.append(b"</sourceDesc>")
-
-        tei_tags.append(b"<body>")
+        buf = bytearray(_TEI_OPEN)
+        buf += TestCitation.build_xml(article.bibliography)
+        buf += _BODY_OPEN
         for section in article.sections:
-            tei_tags.append(TestSection.build_xml(section))
+            buf += TestSection.build_xml(section)
         for xml_id, table in article.tables.items():
-            tei_tags.append(TestTable.build_xml(table, xml_id))
-        tei_tags.append(b"</body>")
-
-        tei_tags.append(b"<listBibl>")
+            buf += TestTable.build_xml(table, xml_id)
+        buf += _LISTBIBL_OPEN
         for xml_id, citation in article.citations.items():
-            tei_tags.append(TestCitation.build_xml(citation, xml_id=xml_id))
-        tei_tags.append(b"</listBibl>")
+            buf += TestCitation.build_xml(citation, xml_id=xml_id)
+        buf += _TEI_CLOSE
 
-        tei_tags.append(b"</TEI>")
+        return bytes(buf)
 
-        return b"".join(tei_tags)
+    def test_empty_input(self):  # noqa: D102
+        with pytest.raises(GrobidParserError, match="Invalid XML"):
+            Parser(b"")
 
     def test_no_body(self):  # noqa: D102
         xml = b"<TEI></TEI>"
@@ -103,30 +163,62 @@ class TestParse:
 
         assert tei.parse() == article
 
+    def test_parse_stream(self):
+        """Streaming parse matches the DOM parse."""
+        article = Article(
+            bibliography=Citation(
+                title="Test",
+                authors=[Author(PersonName("Doe", "John"))],
+            ),
+            keywords=set(),
+            tables=dict(test=Table(heading="Test", rows=[["Foo", "Bar"]])),
+            sections=[Section("Introduction", [RefText("Lorem Ipsum")])],
+            citations=dict(test=Citation(title="Test2")),
+        )
 
-class TestTitle:
-    """Unit tests for the title function."""
+        stream = io.BytesIO(TestParse.build_xml(article))
 
-    def test_valid_tag(self):  # noqa: D102
-        title = "Test"
-        xml = bytes(f"<title>{title}</title>", encoding="utf-8")
-        tei = Parser(xml)
+        assert Parser.parse_stream(stream) == article
 
-        assert tei.title(tei.soup) == title
+    def test_large_article(self, large_article, large_article_xml):
+        """Round-trips a document with many sections and citations.
 
-    def test_valid_title_attr(self):  # noqa: D102
-        title = "Test"
-        xml = bytes(
-            f"<div><title><Invalid</title><title type='main'>{title}</></div>",
-            encoding="utf-8",
-        )
-        tei = Parser(xml)
+        The fixtures are session-scoped, so repeated runs exercise the
+        parser rather than fixture construction; a benchmark harness can
+        reuse them for regression tracking.
+        """
+        assert Parser(large_article_xml).parse() == large_article
+        assert Parser.parse_stream(io.BytesIO(large_article_xml)) == large_article
+
+    def test_parse_stream_no_body(self):  # noqa: D102
+        stream = io.BytesIO(b"<TEI></TEI>")
+
+        with pytest.raises(GrobidParserError, match="Missing body"):
+            Parser.parse_stream(stream)
+
+
+class TestTitle:
+    """Unit tests for the title function."""
+
+    @pytest.mark.parametrize(
+        "xml,attrs",
+        [
+            (b"<title>Test</title>", {}),
+            (
+                b"<div><title><Invalid</title><title type='main'>Test</></div>",
+                {"type": "main"},
+            ),
+        ],
+    )
+    def test_valid_tag(self, parser_factory, xml, attrs):
+        """Title text is found with and without attribute filters."""
+        tei = parser_factory(xml)
 
-        assert tei.title(tei.soup, attrs={"type": "main"}) == title
+        assert tei.title(tei.soup, attrs=attrs) == "Test"
 
-    def test_invalid_tag(self):  # noqa: D102
+    def test_invalid_tag(self, parser_factory):  # noqa: D102
         xml = b"<nottitle>Invalid</nottitle>"
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         # NOTE: should it return empty string over None?
         assert tei.title(tei.soup) == ""
@@ -135,22 +227,22 @@ class TestTitle:
 class TestTarget:
     """Unit tests for the target function."""
 
-    def test_valid_tag(self):  # noqa: D102
+    def test_valid_tag(self, parser_factory):  # noqa: D102
         target = "http://avalidtarget.org"
         xml = bytes(f"<ptr target='{target}'/>", encoding="utf-8")
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.target(tei.soup) == target
 
-    def test_no_target(self):  # noqa: D102
+    def test_no_target(self, parser_factory):  # noqa: D102
         xml = b"<ptr/>"
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.target(tei.soup) is None
 
-    def test_empty_tag(self):  # noqa: D102
+    def test_empty_tag(self, parser_factory):  # noqa: D102
         xml = b"<ptr/>"
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.target(tei.soup) is None
 
@@ -158,14 +250,14 @@ class TestTarget:
 class TestIdno:
     """Unit tests for the idno function."""
 
-    def test_valid_tag(self):  # noqa: D102
+    def test_valid_tag(self, parser_factory):  # noqa: D102
         idno = "test"
         xml = bytes(f"<idno>{idno}</idno>", encoding="utf-8")
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.idno(tei.soup) == idno
 
-    def test_valid_idno_attr(self):
+    def test_valid_idno_attr(self, parser_factory):
         """Checks if attribute dictionary search is prioritised over empty tags."""
         idno = "test"
         type_ = "DOI"
@@ -173,13 +265,13 @@ class TestIdno:
             f"<div><idno>Invalid</idno><idno type='{type_}'>{idno}</idno></div>",
             encoding="utf-8",
         )
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.idno(tei.soup, attrs={"type": type_}) == idno
 
-    def test_empty_tag(self):  # noqa: D102
+    def test_empty_tag(self, parser_factory):  # noqa: D102
         xml = bytes("<idno></idno>", encoding="utf-8")
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.idno(tei.soup) is None
 
@@ -187,16 +279,16 @@ class TestIdno:
 class TestPublisher:
     """Unit tests for the publisher function."""
 
-    def test_valid_tag(self):  # noqa: D102
+    def test_valid_tag(self, parser_factory):  # noqa: D102
         publisher = "Foo Bar"
         xml = bytes(f"<publisher>{publisher}</publisher>", encoding="utf-8")
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.publisher(tei.soup) == publisher
 
-    def test_empty_tag(self):  # noqa: D102
+    def test_empty_tag(self, parser_factory):  # noqa: D102
         xml = bytes("<publisher></publisher>", encoding="utf-8")
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.publisher(tei.soup) is None
 
@@ -204,7 +296,7 @@ class TestPublisher:
 class TestKeywords:
     """Unit tests for the keywords function."""
 
-    def test_valid_tags(self):  # noqa: D102
+    def test_valid_tags(self, parser_factory):  # noqa: D102
         keywords = {"Keywords", "Tags"}  # keywords are nouns
         term_tags: list[bytes] = [b"<keywords>"]
         for keyword in keywords:
@@ -213,13 +305,13 @@ class TestKeywords:
         term_tags.append(b"</keywords>")
 
         xml = b"".join(term_tags)
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.keywords(tei.soup) == keywords
 
-    def test_empty_tag(self):  # noqa: D102
+    def test_empty_tag(self, parser_factory):  # noqa: D102
         xml = b"<term></term>"
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.keywords(tei.soup) == set()
 
@@ -227,100 +319,75 @@ class TestKeywords:
 class TestDate:
     """Unit tests for the date function."""
 
-    def test_valid_tag_year(self):
-        """Date with only the year."""
-        year = "2022"
-        date = Date(year=year)
-        xml = bytes(f"<date when='{year}'/>", encoding="utf-8")
-        tei = Parser(xml)
-
-        assert tei.date(tei.soup) == date
-
-    def test_valid_tag_year_month(self):
-        """Date with only the year and month."""
-        year = "2022"
-        month = "05"
-        date = Date(year=year, month=month)
-        xml = bytes(f"<date when='{year}-{month}'/>", encoding="utf-8")
-        tei = Parser(xml)
-
-        assert tei.date(tei.soup) == date
-
-    def test_valid_tag_full_date(self):
-        """Date with year, month and day."""
-        year = "2022"
-        month = "05"
-        day = "03"
-        date = Date(year=year, month=month, day=day)
-        xml = bytes(f"<date when='{year}-{month}-{day}'/>", encoding="utf-8")
-        tei = Parser(xml)
+    @pytest.mark.parametrize(
+        "when,date",
+        [
+            ("2022", Date("2022")),
+            ("2022-05", Date("2022", "05")),
+            ("2022-05-03", Date("2022", "05", "03")),
+        ],
+    )
+    def test_valid_tag(self, parser_factory, when, date):
+        """Dates with a year, month and day part in the when attribute."""
+        xml = bytes(f"<date when='{when}'/>", encoding="utf-8")
+        tei = parser_factory(xml)
 
         assert tei.date(tei.soup) == date
 
-    def test_empty_tag(self):  # noqa: D102
+    def test_empty_tag(self, parser_factory):  # noqa: D102
         xml = b"<date when=''/>"
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.date(tei.soup) is None
 
 
+_CITATION_TMPL = (
+    b"<biblStruct%b><title type='main'>%b</title>%b%b%b%b%b%b%b</biblStruct>"
+)
+
+
 class TestCitation:
     """Unit tests for the citation function."""
 
     @staticmethod
     def build_xml(citation: Citation, xml_id: str | None = None) -> bytes:
         """Create XML from Citation object."""
-        bibl_tags: list[bytes] = []
-        if xml_id:
-            bibl_tags.append(bytes(f"<biblStruct xml:id='{xml_id}'>", encoding="utf-8"))
-        else:
-            bibl_tags.append(b"<biblStruct>")
-
-        bibl_tags.append(
-            bytes(f"<title type='main'>{citation.title}</title>", encoding="utf-8")
-        )
-
-        bibl_tags.append(TestAuthors.build_xml(citation.authors))
-
+        ids_xml = b""
         if citation.ids is not None:
-            for k, v in citation.ids.__dict__.items():
-                if v is None:
-                    continue
-                bibl_tags.append(
-                    bytes(f"<idno type='{k}'>{v}</idno>", encoding="utf-8")
-                )
-
-        if citation.scope is not None:
-            for k, v in citation.scope.__dict__.items():
-                if v is None:
-                    continue
-                bibl_tags.append(
-                    bytes(f"<biblScope unit='{k}'>{v}</biblScope>", encoding="utf-8")
-                )
-
-        if citation.target:
-            bibl_tags.append(
-                bytes(f"<ptr target='{citation.target}' />", encoding="utf-8")
+            ids_xml = b"".join(
+                b"<idno type='%b'>%b</idno>" % (name.encode(), value.encode())
+                for name in _ID_FIELDS
+                if (value := getattr(citation.ids, name)) is not None
             )
 
-        if citation.publisher:
-            bibl_tags.append(
-                bytes(f"<publisher>{citation.publisher}</publisher>", encoding="utf-8")
-            )
-
-        if citation.series:
-            bibl_tags.append(
-                bytes(f"<title level='s'>{citation.series}</title>", encoding="utf-8")
-            )
-
-        if citation.journal:
-            bibl_tags.append(
-                bytes(f"<title level='j'>{citation.journal}</title>", encoding="utf-8")
+        scope_xml = b""
+        if citation.scope is not None:
+            scope_xml = b"".join(
+                b"<biblScope unit='%b'>%b</biblScope>"
+                % (name.encode(), str(value).encode())
+                for name in _SCOPE_FIELDS
+                if (value := getattr(citation.scope, name)) is not None
             )
 
-        bibl_tags.append(b"</biblStruct>")
-
-        return b"".join(bibl_tags)
+        return _CITATION_TMPL % (
+            b" xml:id='%b'" % xml_id.encode() if xml_id else b"",
+            citation.title.encode(),
+            TestAuthors.build_xml(citation.authors),
+            ids_xml,
+            scope_xml,
+            b"<ptr target='%b' />" % citation.target.encode()
+            if citation.target
+            else b"",
+            b"<publisher>%b</publisher>" % citation.publisher.encode()
+            if citation.publisher
+            else b"",
+            b"<title level='s'>%b</title>" % citation.series.encode()
+            if citation.series
+            else b"",
+            b"<title level='j'>%b</title>" % citation.journal.encode()
+            if citation.journal
+            else b"",
+        )
 
     def test_valid_tags(self):  # noqa: D102
         citation = Citation(
@@ -355,52 +422,40 @@ class TestCitation:
 class TestScope:
     """Unit tests for the scope function."""
 
-    def test_valid_tag_volume(self):  # noqa: D102
-        volume = 7
-        scope = Scope(volume=volume)
-        xml = bytes(f"<biblScope unit='volume'>{volume}</biblScope>", encoding="utf-8")
-        tei = Parser(xml)
-
-        assert tei.scope(tei.soup) == scope
-
-    def test_valid_tag_page(self):  # noqa: D102
-        page = 1
-        scope = Scope(pages=PageRange(page, page))
-        xml = bytes(f"<biblScope unit='page'>{page}</biblScope>", encoding="utf-8")
-        tei = Parser(xml)
-
-        assert tei.scope(tei.soup) == scope
-
-    def test_valid_tag_page_range(self):  # noqa: D102
-        from_page, to_page = 1, 2
-        scope = Scope(pages=PageRange(from_page, to_page))
-        xml = bytes(
-            f"<biblScope unit='page' from='{from_page}' to='{to_page}'>",
-            encoding="utf-8",
-        )
-        tei = Parser(xml)
+    @pytest.mark.parametrize(
+        "xml,scope",
+        [
+            (b"<biblScope unit='volume'>7</biblScope>", Scope(volume=7)),
+            (b"<biblScope unit='page'>1</biblScope>", Scope(pages=PageRange("1", "1"))),
+            (
+                b"<biblScope unit='page' from='1' to='2'>",
+                Scope(pages=PageRange("1", "2")),
+            ),
+            # non-numeric pages are preserved as-is
+            (
+                b"<biblScope unit='page'>iv</biblScope>",
+                Scope(pages=PageRange("iv", "iv")),
+            ),
+        ],
+    )
+    def test_valid_tag(self, parser_factory, xml, scope):
+        """Volume, single page, page range and non-numeric page units."""
+        tei = parser_factory(xml)
 
         assert tei.scope(tei.soup) == scope
 
-    def test_invalid_page_type(self):
-        """Page should be of int."""
-        page = "one"
-        xml = bytes(f"<biblScope unit='page'>{page}</biblScope>", encoding="utf-8")
-        tei = Parser(xml)
-
-        assert tei.scope(tei.soup) is None
-
-    def test_empty_page(self):  # noqa: D102
-        xml = b"<biblScope unit='page'></biblScope>"
-        tei = Parser(xml)
-
-        assert tei.scope(tei.soup) is None
-
-    def test_invalid_volume_type(self):
-        """Volume should be of int."""
-        volume = "seven"
-        xml = bytes(f"<biblScope unit='volume'>{volume}</biblScope>", encoding="utf-8")
-        tei = Parser(xml)
+    @pytest.mark.parametrize(
+        "xml",
+        [
+            # empty page
+            b"<biblScope unit='page'></biblScope>",
+            # volume should be an int
+            b"<biblScope unit='volume'>seven</biblScope>",
+        ],
+    )
+    def test_invalid_tag(self, parser_factory, xml):
+        """Empty pages and non-numeric volumes produce no scope."""
+        tei = parser_factory(xml)
 
         assert tei.scope(tei.soup) is None
 
@@ -411,43 +466,31 @@ class TestAuthors:
     @staticmethod
     def build_xml(authors: list[Author]) -> bytes:
         """Create XML from list of author objects."""
-        author_tags: list[bytes] = [b"<analytic>"]
+        buf = bytearray(_ANALYTIC_OPEN)
         for author in authors:
-            author_tags.append(b"<author>")
-            author_tags.append(b"<persName>")
+            buf += _AUTHOR_OPEN
             if (first_name := author.person_name.first_name) is not None:
-                author_tags.append(
-                    bytes(
-                        f"<forename type='first'>{first_name}</forename>",
-                        encoding="utf-8",
-                    )
-                )
-            author_tags.append(
-                bytes(
-                    f"<surname>{author.person_name.surname}</surname>",
-                    encoding="utf-8",
-                )
-            )
-
-            author_tags.append(b"</persName>")
+                buf += b"<forename type='first'>%b</forename>" % first_name.encode()
+            buf += b"<surname>%b</surname>" % author.person_name.surname.encode()
+            buf += _PERSNAME_CLOSE
 
             if (email := author.email) is not None:
-                author_tags.append(bytes(f"<email>{email}</email>", encoding="utf-8"))
+                buf += b"<email>%b</email>" % email.encode()
 
-            author_tags.append(b"<affiliation>")
+            buf += _AFFILIATION_OPEN
             for affiliation in author.affiliations:
-                for k, v in affiliation.__dict__.items():
-                    if v is None:
+                for name in _AFFILIATION_FIELDS:
+                    if (value := getattr(affiliation, name)) is None:
                         continue
-                    author_tags.append(
-                        bytes(f"<orgName type='{k}'>{v}</orgName>", encoding="utf-8")
+                    buf += b"<orgName type='%b'>%b</orgName>" % (
+                        name.encode(),
+                        value.encode(),
                     )
-            author_tags.append(b"</affiliation>")
-            author_tags.append(b"</author>")
+            buf += _AUTHOR_CLOSE
 
-        author_tags.append(b"</analytic>")
+        buf += _ANALYTIC_CLOSE
 
-        return b"".join(author_tags)
+        return bytes(buf)
 
     def test_valid_tags(self):
         """Tests all supported tags."""
@@ -478,25 +521,32 @@ class TestSection:
     @staticmethod
     def build_xml(section: Section) -> bytes:
         """Create XML from Section object."""
-        div_tags: list[bytes] = [b"<div>"]
+        buf = bytearray(b"<div>")
 
-        div_tags.append(bytes(f"<head>{section.title}</title>", encoding="utf-8"))
+        buf += b"<head>%b</title>" % section.title.encode()
 
         for p in section.paragraphs:
-            text_xml = p.text
-            for ref in p.refs:
+            # Walk the text left to right, emitting refs at their
+            # offsets, instead of re-splicing the string per ref
+            parts: list[str] = []
+            cursor = 0
+            for ref in sorted(p.refs, key=lambda ref: ref.start):
                 marker = None
                 if ref.marker:
                     marker = ref.marker.name
-                ref_xml = f"<ref type='{marker}' target='{ref.target}'>{p.text[ref.start:ref.end]}</ref>"  # noqa: E501
-                text_xml = text_xml[: ref.start] + ref_xml + text_xml[ref.end :]
-            div_tags.append(bytes(f"<p>{text_xml}</p>", encoding="utf-8"))
+                parts.append(p.text[cursor : ref.start])
+                parts.append(
+                    f"<ref type='{marker}' target='{ref.target}'>{p.text[ref.start:ref.end]}</ref>"  # noqa: E501
+                )
+                cursor = ref.end
+            parts.append(p.text[cursor:])
+            buf += b"<p>%b</p>" % "".join(parts).encode()
 
-        div_tags.append(b"</div>")
+        buf += b"</div>"
 
-        return b"".join(div_tags)
+        return bytes(buf)
 
-    def test_valid_tag(self):  # noqa: D102
+    def test_valid_tag(self, parser_factory):  # noqa: D102
         text = "Lorem ipsum"
         section = Section(
             title="test",
@@ -514,13 +564,13 @@ class TestSection:
         assert section.to_str() == text
 
         xml = TestSection.build_xml(section)
-        tei = Parser(xml)
+        tei = parser_factory(xml)
         # NOTE: woraround for forced capitalisation
         section.title = section.title.capitalize()
 
         assert tei.section(tei.soup) == section
 
-    def test_valid_tag_no_ref(self):
+    def test_valid_tag_no_ref(self, parser_factory):
         """Test for text that doesn't contain a reference."""
         text = "Lorem ipsum"
         section = Section(
@@ -539,13 +589,13 @@ class TestSection:
         assert section.to_str() == text
 
         xml = TestSection.build_xml(section)
-        tei = Parser(xml)
+        tei = parser_factory(xml)
         # NOTE: woraround for forced capitalisation
         section.title = section.title.capitalize()
 
         assert tei.section(tei.soup) == section
 
-    def test_valid_tag_invalid_ref(self):
+    def test_valid_tag_invalid_ref(self, parser_factory):
         """Test for text that contains a ref with an invalid marker (None)."""
         text = "Lorem ipsum"
         section = Section(
@@ -564,26 +614,26 @@ class TestSection:
         assert section.to_str() == text
 
         xml = TestSection.build_xml(section)
-        tei = Parser(xml)
+        tei = parser_factory(xml)
         # NOTE: woraround for forced capitalisation
         section.title = section.title.capitalize()
 
         assert tei.section(tei.soup) == section
 
-    def test_title_tag(self):
+    def test_title_tag(self, parser_factory):
         """Test for divs that don't have <head> tag (i.e. <abstract>)."""
         title = "abstract"
         xml = bytes(f"<{title}></{title}>", encoding="utf-8")
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         section = tei.section(tei.soup, title=title)
 
         assert section is not None
         assert section.title == title
 
-    def test_empty_tag(self):  # noqa: D102
+    def test_empty_tag(self, parser_factory):  # noqa: D102
         xml = b"<div></div>"
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.section(tei.soup) is None
 
@@ -594,43 +644,39 @@ class TestTable:
     @staticmethod
     def build_xml(table: Table, xml_id: str | None = None) -> bytes:
         """Create XML from Table object."""
-        figure_tags: list[bytes] = []
+        buf = bytearray()
         if xml_id:
-            figure_tags.append(
-                bytes(f"<figure xml:id='{xml_id}' type='table'>", encoding="utf-8")
-            )
+            buf += b"<figure xml:id='%b' type='table'>" % xml_id.encode()
         else:
-            figure_tags.append(b"<figure type='table'>")
+            buf += b"<figure type='table'>"
 
-        figure_tags.append(bytes(f"<head>{table.heading}</head>", encoding="utf-8"))
+        buf += b"<head>%b</head>" % table.heading.encode()
 
         if table.description is not None:
-            figure_tags.append(
-                bytes(f"<figDesc>{table.description}</figDesc>", encoding="utf-8")
-            )
+            buf += b"<figDesc>%b</figDesc>" % table.description.encode()
 
         for row in table.rows:
-            figure_tags.append(b"<row>")
+            buf += _ROW_OPEN
             for cell in row:
-                figure_tags.append(bytes(f"<cell>{cell}</cell>", encoding="utf-8"))
-            figure_tags.append(b"</row>")
+                buf += b"<cell>%b</cell>" % cell.encode()
+            buf += _ROW_CLOSE
 
-        figure_tags.append(b"</figure>")
+        buf += b"</figure>"
 
-        return b"".join(figure_tags)
+        return bytes(buf)
 
-    def test_valid_tag(self):  # noqa: D102
+    def test_valid_tag(self, parser_factory):  # noqa: D102
         table = Table(heading="Test", description="Lorem Ipsum", rows=[["Foo", "Bar"]])
         xml = TestTable.build_xml(table)
 
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.table(tei.soup) == table
 
-    def test_empty_tag(self):
+    def test_empty_tag(self, parser_factory):
         """Empty head tag."""
         xml = b"<figure><head></head></figure>"
-        tei = Parser(xml)
+        tei = parser_factory(xml)
 
         assert tei.table(tei.soup) is None
 